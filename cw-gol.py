@@ -1,6 +1,15 @@
 import argparse
 
-from cwgol import main
+from cwgol import ENGINES, main
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a command line count that cannot be negative."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
 
 if __name__ == "__main__":
 
@@ -10,5 +19,8 @@ if __name__ == "__main__":
     parser.add_argument("-g", "--generations", help="Number of generations", type=int, default=100)
     parser.add_argument("-s", "--saturation", help="% of the board populated at start", type=float, default=.4)
     parser.add_argument("-p", "--pattern", help=".cell file to load a pattern, if left empty or set to random the board uses random params for a random board", type=str, default='random')
+    parser.add_argument("-e", "--engine", help="Board implementation used to step the simulation", choices=list(ENGINES), default='numpy')
+    parser.add_argument("-j", "--jump", help="Generations to fast forward before drawing", type=non_negative_int, default=0)
+    parser.add_argument("--hashlife", help="Fast forward the jump with HashLife", action="store_true")
     args = parser.parse_args()
-    main(args.board_size, args.freq, args.generations, args.saturation, args.pattern)
\ No newline at end of file
+    main(args.board_size, args.freq, args.generations, args.saturation, args.pattern, args.engine, args.jump, args.hashlife)
\ No newline at end of file
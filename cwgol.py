@@ -1,11 +1,27 @@
 import argparse
 import cProfile
 import collections
+import functools
+import os
 import random
+import sys
 import timeit
-from array import array
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep, perf_counter
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, Board falls back to the NumPy kernel
+    njit = None  # type: ignore[assignment]
+
+try:
+    import cupy as cp  # type: ignore[import-not-found]
+except ImportError:  # cupy is optional, only CupyBoard needs it
+    cp = None
+
 """
 ## Rules
 - A living cell dies if it has fewer than two living neighboring cells.
@@ -16,61 +32,218 @@ from time import sleep, perf_counter
 Cell = collections.namedtuple("Cell", ['x', 'y'])
 LIVE_CELL_SYMBOL = 'o'
 DEAD_CELL_SYMBOL = ' '
+# text drawn for a dead and a live cell, indexed by the cell value
+CELL_STRINGS = (f"{DEAD_CELL_SYMBOL} ", f"{LIVE_CELL_SYMBOL} ")
+# clear the terminal and move the cursor to the top left corner
+CLEAR_SCREEN = chr(27) + "[2J" + chr(27) + "[1;1f"
+# (dy, dx) offsets of the eight cells surrounding a cell
+NEIGHBOUR_OFFSETS = tuple((dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx)
+# One byte per cell, a cell only ever holds 0 or 1
+CELL_DTYPE = np.uint8
+# Boards at least this big are stepped splitting the rows across threads
+PARALLEL_BOARD_SIZE = 256
+# Number of recently stepped HashLife nodes kept alive with their memoized futures
+HASHLIFE_CACHE_SIZE = 1 << 18
+# Width of the square thread blocks of the CUDA kernel
+CUDA_TILE_SIZE = 16
+
+
+def _rule(window: int) -> int:
+    """Next state of the center cell of a 3x3 window.
+
+    Bits 0-2, 3-5 and 6-8 of window are the top, middle and bottom rows, so
+    the center cell is bit 4.
+    """
+    alive = window >> 4 & 1
+    n = window.bit_count() - alive
+    return int(n == 3) | (alive & (n == 2))
+
+
+# Next state of the center cell of every 3x3 window
+RULE_TABLE = bytes(_rule(window) for window in range(512))
+
+
+# Compiled once per argument types for every board size, and cache=True keeps
+# each build's machine code on disk for the next run. Baking the size and
+# strides in as literals is not worth a compile per size: the loop is already
+# vectorized and runs no faster with them. numba keys its cache by the function
+# it compiles, so the serial and parallel builds each need their own def.
+if njit is not None:
+    @njit(cache=True, boundscheck=False, nogil=True, inline='always')
+    def _step_row(board: np.ndarray, out: np.ndarray, y: int, size: int) -> None:
+        """Write row y of the next generation of the padded board into out.
+
+        Both arrays are (size+2, size+2) with a dead halo, only the interior of
+        out is written. Rows are swept whole: each board row is read for three
+        consecutive output rows while it is still in cache, and full width inner
+        loops are what numba vectorizes, so blocking the sweep into tiles only
+        slows it down.
+        """
+        # bind the rows once, the inner loop then only offsets x
+        above, row, below = board[y - 1], board[y], board[y + 1]
+        out_row = out[y]
+        for x in range(1, size + 1):
+            n = (above[x - 1] + above[x] + above[x + 1]
+                 + row[x - 1] + row[x + 1]
+                 + below[x - 1] + below[x] + below[x + 1])
+            # live iff n == 3, or alive and n == 2, without branching
+            out_row[x] = (n == 3) | (row[x] & (n == 2))
+
+    @njit(cache=True, boundscheck=False, nogil=True)
+    def _step_serial(board: np.ndarray, out: np.ndarray, size: int) -> None:
+        """Write the next generation of the padded board into out."""
+        for y in range(1, size + 1):
+            _step_row(board, out, y, size)
+
+    @njit(cache=True, boundscheck=False, nogil=True, parallel=True)
+    def _step_parallel(board: np.ndarray, out: np.ndarray, size: int) -> None:
+        """Write the next generation of the padded board into out, rows split over threads."""
+        for y in prange(1, size + 1):
+            _step_row(board, out, y, size)
+
+
+def _numpy_step(board: np.ndarray, out: np.ndarray, neighbours: np.ndarray, start: int, stop: int) -> None:
+    """Write rows start..stop-1 of the next generation of the padded board into out.
+
+    Rows are counted without the halo. Neighbour counts are accumulated in
+    place in the same rows of the neighbours buffer from the eight shifted
+    views of the board, NumPy releases the GIL while doing it so stripes of
+    rows can be stepped by several threads.
+    """
+    size = neighbours.shape[1]
+    counts = neighbours[start:stop]
+    (dy, dx), *offsets = NEIGHBOUR_OFFSETS
+    np.copyto(counts, board[start + 1 + dy:stop + 1 + dy, 1 + dx:1 + dx + size])
+    for dy, dx in offsets:
+        counts += board[start + 1 + dy:stop + 1 + dy, 1 + dx:1 + dx + size]
+    # live iff n == 3, or alive and n == 2
+    next_state = out[start + 1:stop + 1, 1:-1]
+    np.equal(counts, 2, out=next_state)
+    next_state &= board[start + 1:stop + 1, 1:-1]
+    next_state |= counts == 3
+
+
+@functools.cache
+def _stripe_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by the NumPy steps of large boards."""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
 
 class Board:
-    board: array[int]
-    temp_board: array[int]
+    board: np.ndarray
+    temp_board: np.ndarray
+    neighbours: np.ndarray
 
     def __init__(self, board_size: int):
         self.board_size = board_size
         self.board = self.make_board(board_size)
         self.temp_board = self.make_board(board_size)
+        # scratch neighbour counts of the NumPy step, fully rewritten every step
+        self.neighbours = np.empty((board_size, board_size), dtype=CELL_DTYPE)
 
     @staticmethod
-    def make_board(board_size: int) -> array[int]:
-        """Create a flat array representing a 2D board.
+    def make_board(board_size: int) -> np.ndarray:
+        """Create a 2D array representing the board.
+
+        The board is surrounded by a one cell wide halo that is always dead, so
+        neighbours of edge cells can be read without bounds checks.
 
         Args:
             board_size: Size of the square board.
 
         Returns:
-            Flat array initialized with zeros (all dead cells).
+            (board_size+2, board_size+2) byte array initialized with zeros (all dead cells).
         """
-        return array('I', [0 for _ in range(board_size*board_size)])
+        return np.zeros((board_size + 2, board_size + 2), dtype=CELL_DTYPE)
 
     def draw_board(self, title: str = "") -> None:
         """Render the board to terminal.
 
+        The whole frame is built first and written with a single write call.
+
         Args:
             title: Optional title to display above the board.
         """
-        print(chr(27) + "[2J")
-        print(chr(27) + "[1;1f")
-        board_string = ""
-        for i, line in enumerate(self.board):
-            if i % self.board_size == 0:
-                board_string+='\n'
-                print()
-            if line:
-                board_string+=f"{LIVE_CELL_SYMBOL} "
-            else:
-                board_string += f"{DEAD_CELL_SYMBOL} "
-        print(title)
-        print(board_string)
+        sys.stdout.write(CLEAR_SCREEN + title + "\n" + "\n".join(self.board_lines()) + "\n")
+        sys.stdout.flush()
+
+    def board_lines(self) -> list[str]:
+        """Render every row of the board as text.
+
+        Returns:
+            One string per row, two characters per cell.
+        """
+        strings = CELL_STRINGS
+        return ["".join([strings[cell] for cell in row]) for row in self.board[1:-1, 1:-1].tolist()]
+
+    def check_cell(self, x: int, y: int) -> None:
+        """Check that a cell is inside the board.
 
-    def set_cell(self, cell: Cell, value: bool) -> None:
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+
+        Raises:
+            IndexError: If the cell is outside the board.
+        """
+        size = self.board_size
+        if not (0 <= x < size and 0 <= y < size):
+            raise IndexError(f"Cell ({x}, {y}) is outside the board, board size: {size}")
+
+    def set_cell(self, x: int, y: int, value: bool) -> None:
         """Set a cell's state.
 
         Args:
-            cell: Cell coordinates.
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
             value: True for alive, False for dead.
+
+        Raises:
+            IndexError: If the cell is outside the board.
+        """
+        self.check_cell(x, y)
+        self.board[y + 1, x + 1] = value
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get a cell's state.
+
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+
+        Returns:
+            True if the cell is alive.
+        """
+        return bool(self.board[y + 1, x + 1])
+
+    def to_array(self) -> np.ndarray:
+        """Copy the board to a dense array.
+
+        Returns:
+            (board_size, board_size) byte array, indexed [y, x].
         """
-        self.board[cell.y*self.board_size + cell.x] = value
+        return self.board[1:-1, 1:-1].copy()
+
+    def set_array(self, array: np.ndarray) -> None:
+        """Replace every cell of the board.
 
-    def zero_temp_board(self) -> None:
-        """Clear the temporary board by setting all cells to dead."""
-        for i in range(len(self.temp_board)):
-            self.temp_board[i] = False
+        Args:
+            array: (board_size, board_size) array indexed [y, x], non zero cells are alive.
+        """
+        self.board[1:-1, 1:-1] = array != 0
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "Board":
+        """Create a board from a dense array.
+
+        Args:
+            array: Square array indexed [y, x], non zero cells are alive.
+
+        Returns:
+            Board with the same living cells.
+        """
+        board = cls(array.shape[0])
+        board.set_array(array)
+        return board
 
     def random_cells(self, cell_number: int) -> set[Cell]:
         """Generate a set of random cell coordinates.
@@ -79,12 +252,13 @@ class Board:
             cell_number: Number of random cells to generate.
 
         Returns:
-            Set of Cell objects with random coordinates.
+            Set of cell_number distinct Cell objects with random coordinates, or
+            every cell of the board if it has fewer cells.
         """
-        cells = set()
-        for _ in range(cell_number):
-            cells.add(Cell(x=random.choice(range(self.board_size)), y=random.choice(range(self.board_size))))
-        return cells
+        size = self.board_size
+        # sampling flat indices without replacement avoids colliding draws
+        indices = random.sample(range(size * size), k=min(cell_number, size * size))
+        return {Cell(x=index % size, y=index // size) for index in indices}
 
     def set_random_board(self, initial_cell_count: int = 10) -> None:
         """Populate the board with random living cells.
@@ -92,7 +266,12 @@ class Board:
         Args:
             initial_cell_count: Number of cells to set alive randomly.
         """
-        [self.set_cell(cell, True) for cell in self.random_cells(initial_cell_count)]
+        cells = self.random_cells(initial_cell_count)
+        if not cells:
+            return
+        # set all the cells with a single indexed store, shifted past the halo
+        xs, ys = np.array([(cell.x, cell.y) for cell in cells]).T
+        self.board[ys + 1, xs + 1] = 1
 
     def number_of_neighbours(self, cy: int, cx: int) -> int:
         """Count living neighbors around a cell.
@@ -106,49 +285,75 @@ class Board:
         """
         count = 0
         board = self.board
-        size = self.board_size
 
-        # Search neighbouring cells
-        for dy in [-1, 0, 1]:
-            for dx in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    # ignore central cell
-                    continue
-                nx, ny = cx + dx, cy + dy
-                if 0<=nx< size and 0<=ny<size:
-                    count += board[ny*size+nx]
+        # The halo keeps every neighbour inside the array, shift to padded coordinates
+        py, px = cy + 1, cx + 1
+        for dy, dx in NEIGHBOUR_OFFSETS:
+            count += board[py + dy, px + dx]
 
-        return count
+        return int(count)
 
     def board_step(self) -> None:
         """Execute one generation of Conway's Game of Life.
 
-        Applies Conway's rules to every cell and generates the next board state.
+        Applies Conway's rules to every cell and writes the next board state
+        into temp_board, then swaps the two boards. Every interior cell of
+        temp_board is overwritten, so it never needs clearing. Without numba
+        boards of PARALLEL_BOARD_SIZE or more are stepped by a thread pool, one
+        horizontal stripe of rows per thread.
         """
-        self.zero_temp_board()
         size = self.board_size
-        for cell_idx in range(len(self.board)):
-            py = cell_idx // size
-            px = cell_idx - ( py * size)
-
-            nn = self.number_of_neighbours(py, px)
-            is_alive = self.board[py * size + px]
-            if is_alive:
-                new_value = 2 <= nn <= 3
-            else:
-                new_value = nn == 3
-            self.temp_board[py * size + px] = new_value
+        board = self.board
+        temp_board = self.temp_board
 
-        self.board, self.temp_board = self.temp_board, self.board
+        if njit is not None:
+            kernel = _step_parallel if size >= PARALLEL_BOARD_SIZE else _step_serial
+            kernel(board, temp_board, size)
+        elif size >= PARALLEL_BOARD_SIZE:
+            bounds = np.linspace(0, size, (os.cpu_count() or 1) + 1, dtype=int).tolist()
+            stripes = [
+                _stripe_executor().submit(_numpy_step, board, temp_board, self.neighbours, start, stop)
+                for start, stop in zip(bounds, bounds[1:])
+            ]
+            for stripe in stripes:
+                stripe.result()
+        else:
+            _numpy_step(board, temp_board, self.neighbours, 0, size)
+
+        self.board, self.temp_board = temp_board, board
+
+    def advance(self, generations: int, use_hashlife: bool = False) -> None:
+        """Advance the board several generations without drawing it.
+
+        HashLife runs the pattern in an unbounded universe and copies back the
+        cells inside the board at the end. It matches stepping while the pattern
+        stays clear of the edges, but cells crossing them are not killed along
+        the way.
 
-    def run(self, periods: int = 10, sleep_time: float = .2) -> None:
+        Args:
+            generations: Number of generations to advance.
+            use_hashlife: Jump ahead with HashLife instead of stepping the board.
+
+        Raises:
+            ValueError: If generations is negative.
+        """
+        if generations < 0:
+            raise ValueError(f"Cannot advance a negative number of generations: {generations}")
+        if use_hashlife:
+            self.set_array(hashlife(self.to_array(), generations))
+        else:
+            for _ in range(generations):
+                self.board_step()
+
+    def run(self, periods: int = 10, sleep_time: float = .2, start: int = 0) -> None:
         """Run the simulation for a specified number of generations.
 
         Args:
             periods: Number of generations to simulate.
             sleep_time: Time to sleep between generations.
+            start: Generation the board is currently at.
         """
-        for step in range(1, periods+1):
+        for step in range(start + 1, start + periods + 1):
             title = f"-- Generation: {step} --"
             self.board_step()
             self.draw_board(title)
@@ -161,12 +366,13 @@ class Board:
             center: Center cell of the blinker pattern.
         """
         # linea vertical de 3
-        self.set_cell(Cell(x=center.x, y=center.y), True)
-        self.set_cell(Cell(x=center.x, y=center.y-1), True)
-        self.set_cell(Cell(x=center.x, y=center.y+1), True)
+        x, y = center
+        self.set_cell(x, y, True)
+        self.set_cell(x, y-1, True)
+        self.set_cell(x, y+1, True)
 
     @staticmethod
-    def load_file_figure(filename: str) -> (list[Cell], int):
+    def load_file_figure(filename: str) -> tuple[list[Cell], int]:
         """Load a plain text figure from a file into the board
 
         Args:
@@ -174,32 +380,642 @@ class Board:
         """
         cells=[]
         with open(filename, 'r') as file:
-            bounding_box_size = 0
-            py = 0
-            for line in file:
-                if line.startswith('!'):
-                    continue
-                py += 1
-                for px, spot in enumerate(list(line.strip())):
-                    if spot == 'O':
-                        cells.append(Cell(x=px, y=py))
-
-                bounding_box_size = max((py, px+1, bounding_box_size))
+            rows = [line.strip() for line in file if not line.startswith('!')]
+
+        bounding_box_size = 0
+        # the first pattern row is y=0, comment lines don't count
+        for py, row in enumerate(rows):
+            for px, spot in enumerate(row):
+                if spot == 'O':
+                    cells.append(Cell(x=px, y=py))
+
+            bounding_box_size = max((py + 1, len(row), bounding_box_size))
 
         return cells, bounding_box_size
 
     def load_patter(self, pattern_cells: list[Cell], bounding_box: int, offset: Cell):
 
-        if bounding_box > self.board_size:
-            raise ValueError(f"Board is too small for pattern pattern size: {bounding_box}, board size: {self.board_size}")
+        size = self.board_size
+        if bounding_box > size:
+            raise ValueError(f"Board is too small for pattern pattern size: {bounding_box}, board size: {size}")
 
         for cell in pattern_cells:
             new_x = cell.x + offset.x
             new_y = cell.y + offset.y
-            if 0 <= new_x < self.board_size and 0 <= new_y < self.board_size:
-                self.set_cell(Cell(new_x, new_y), True)
+            if 0 <= new_x < size and 0 <= new_y < size:
+                self.set_cell(new_x, new_y, True)
+
+def _full_adder(a: int, b: int, c: int) -> tuple[int, int]:
+    """Add three bit-planes bitwise, returning the (sum, carry) bit-planes."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+# maps the binary digits of a BitBoard row to the text of its cells
+_BIT_STRINGS = str.maketrans({'0': CELL_STRINGS[0], '1': CELL_STRINGS[1]})
+
+
+class BitBoard(Board):
+    """Board storing every row as the bits of a Python int.
+
+    Bit x of rows[y+1] is the cell (x, y), the first and last rows are a dead
+    halo so edge rows need no special casing. Neighbour counts for a whole row are
+    computed at once by adding the eight shifted neighbouring rows with bitwise
+    full adders (SWAR), so a step costs a few dozen int operations per row.
+    """
+    rows: list[int]
+
+    def __init__(self, board_size: int):
+        self.board_size = board_size
+        # board_size+2 zeroed rows (all dead cells), halo rows included
+        self.rows = [0] * (board_size + 2)
+
+    def board_lines(self) -> list[str]:
+        """Render every row of the board as text.
+
+        Returns:
+            One string per row, two characters per cell.
+        """
+        # binary digits are most significant first, reverse them so column 0 leads
+        width = f"0{self.board_size}b"
+        return [format(row, width)[::-1].translate(_BIT_STRINGS) for row in self.rows[1:-1]]
+
+    def set_cell(self, x: int, y: int, value: bool) -> None:
+        """Set a cell's state.
+
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+            value: True for alive, False for dead.
+
+        Raises:
+            IndexError: If the cell is outside the board.
+        """
+        self.check_cell(x, y)
+        if value:
+            self.rows[y + 1] |= 1 << x
+        else:
+            self.rows[y + 1] &= ~(1 << x)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get a cell's state.
+
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+
+        Returns:
+            True if the cell is alive.
+        """
+        return bool(self.rows[y + 1] >> x & 1)
+
+    def set_random_board(self, initial_cell_count: int = 10) -> None:
+        """Populate the board with random living cells.
+
+        Args:
+            initial_cell_count: Number of cells to set alive randomly.
+        """
+        rows = self.rows
+        for cell in self.random_cells(initial_cell_count):
+            rows[cell.y + 1] |= 1 << cell.x
+
+    def to_array(self) -> np.ndarray:
+        """Copy the board to a dense array.
+
+        Returns:
+            (board_size, board_size) byte array, indexed [y, x].
+        """
+        size = self.board_size
+        row_bytes = (size + 7) // 8
+        packed = np.frombuffer(b"".join(row.to_bytes(row_bytes, 'little') for row in self.rows[1:-1]), dtype=np.uint8)
+        return np.unpackbits(packed.reshape(size, row_bytes), axis=1, count=size, bitorder='little')
+
+    def set_array(self, array: np.ndarray) -> None:
+        """Replace every cell of the board.
+
+        Args:
+            array: (board_size, board_size) array indexed [y, x], non zero cells are alive.
+        """
+        packed = np.packbits(array != 0, axis=1, bitorder='little')
+        self.rows = [0, *(int.from_bytes(row.tobytes(), 'little') for row in packed), 0]
+
+    def number_of_neighbours(self, cy: int, cx: int) -> int:
+        """Count living neighbors around a cell.
+
+        Args:
+            cy: Y coordinate (row) of center cell.
+            cx: X coordinate (column) of center cell.
+
+        Returns:
+            Number of living neighbors (0-8).
+        """
+        count = 0
+        rows = self.rows
+        # padded rows cy..cy+2 are the rows around cy, shift so the bits of
+        # columns cx-1..cx+1 end up in bits 0..2
+        for row in rows[cy:cy + 3]:
+            count += (row << 1 >> cx & 0b111).bit_count()
+        return count - (rows[cy + 1] >> cx & 1)
+
+    def board_step(self) -> None:
+        """Execute one generation of Conway's Game of Life.
+
+        The count of every row is kept as three bit-planes: ones, twos and
+        fours (set when the count is four or more).
+        """
+        size = self.board_size
+        rows = self.rows
+        mask = (1 << size) - 1
+        full_adder = _full_adder
+
+        next_rows = [0]
+        for above, alive, below in zip(rows, rows[1:], rows[2:]):
+            s_above, c_above = full_adder(above << 1, above, above >> 1)
+            s_below, c_below = full_adder(below << 1, below, below >> 1)
+            s_side, c_side = (alive << 1) ^ (alive >> 1), (alive << 1) & (alive >> 1)
+            ones, c_ones = full_adder(s_above, s_below, s_side)
+            twos, fours = full_adder(c_above, c_below, c_side)
+            twos, carry = twos ^ c_ones, twos & c_ones
+            fours |= carry
+
+            # live iff n == 3, or alive and n == 2
+            next_rows.append(twos & ~fours & (ones | alive) & mask)
+
+        next_rows.append(0)
+        self.rows = next_rows
+
+
+class SparseBoard(Board):
+    """Board storing only the coordinates of the living cells.
+
+    A step only visits living cells and their neighbours, so its cost grows
+    with the population instead of the board area.
+    """
+    live: set[tuple[int, int]]
+
+    def __init__(self, board_size: int):
+        self.board_size = board_size
+        self.live = set()
+
+    def to_array(self) -> np.ndarray:
+        """Convert the living cells to a dense array.
+
+        Returns:
+            (board_size, board_size) byte array, indexed [y, x].
+        """
+        array = np.zeros((self.board_size, self.board_size), dtype=CELL_DTYPE)
+        if self.live:
+            xs, ys = zip(*self.live)
+            array[ys, xs] = 1
+        return array
+
+    def set_array(self, array: np.ndarray) -> None:
+        """Replace every cell of the board.
+
+        Args:
+            array: (board_size, board_size) array indexed [y, x], non zero cells are alive.
+        """
+        ys, xs = np.nonzero(array)
+        self.live = set(zip(xs.tolist(), ys.tolist()))
+
+    def board_lines(self) -> list[str]:
+        """Render every row of the board as text.
+
+        Returns:
+            One string per row, two characters per cell.
+        """
+        rows = [[CELL_STRINGS[0]] * self.board_size for _ in range(self.board_size)]
+        for x, y in self.live:
+            rows[y][x] = CELL_STRINGS[1]
+        return ["".join(row) for row in rows]
+
+    def set_cell(self, x: int, y: int, value: bool) -> None:
+        """Set a cell's state.
+
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+            value: True for alive, False for dead.
+
+        Raises:
+            IndexError: If the cell is outside the board.
+        """
+        self.check_cell(x, y)
+        if value:
+            self.live.add((x, y))
+        else:
+            self.live.discard((x, y))
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get a cell's state.
+
+        Args:
+            x: X coordinate (column) of the cell.
+            y: Y coordinate (row) of the cell.
+
+        Returns:
+            True if the cell is alive.
+        """
+        return (x, y) in self.live
+
+    def set_random_board(self, initial_cell_count: int = 10) -> None:
+        """Populate the board with random living cells.
+
+        Args:
+            initial_cell_count: Number of cells to set alive randomly.
+        """
+        self.live.update((cell.x, cell.y) for cell in self.random_cells(initial_cell_count))
+
+    def number_of_neighbours(self, cy: int, cx: int) -> int:
+        """Count living neighbors around a cell.
+
+        Args:
+            cy: Y coordinate (row) of center cell.
+            cx: X coordinate (column) of center cell.
+
+        Returns:
+            Number of living neighbors (0-8).
+        """
+        live = self.live
+        return sum((cx + dx, cy + dy) in live for dy, dx in NEIGHBOUR_OFFSETS)
+
+    def board_step(self) -> None:
+        """Execute one generation of Conway's Game of Life.
+
+        Every living cell adds one to the count of each of its neighbours, cells
+        that are never counted have no living neighbours and stay dead.
+        """
+        size = self.board_size
+        live = self.live
+
+        counts = collections.Counter(
+            (x + dx, y + dy) for x, y in live for dy, dx in NEIGHBOUR_OFFSETS
+        )
+        # live iff n == 3, or alive and n == 2, cells beyond the edges stay dead
+        self.live = {
+            (x, y) for (x, y), n in counts.items()
+            if (n == 3 or (n == 2 and (x, y) in live)) and 0 <= x < size and 0 <= y < size
+        }
+
+
+# Each block loads its tile plus a one cell border into shared memory, every
+# cell is then counted from shared memory instead of eight global reads
+_CUDA_STEP_SOURCE = r'''
+#define TILE %(tile)d
+
+extern "C" __global__
+void life_step(const unsigned char* board, unsigned char* out, const int size)
+{
+    __shared__ unsigned char tile[TILE + 2][TILE + 2];
+    const int stride = size + 2;
+    // the padded coordinates of the tile start at the block origin
+    const int origin_x = blockIdx.x * TILE;
+    const int origin_y = blockIdx.y * TILE;
+
+    for (int ty = threadIdx.y; ty < TILE + 2; ty += TILE) {
+        for (int tx = threadIdx.x; tx < TILE + 2; tx += TILE) {
+            const int py = origin_y + ty;
+            const int px = origin_x + tx;
+            tile[ty][tx] = (py < stride && px < stride) ? board[py * stride + px] : 0;
+        }
+    }
+    __syncthreads();
+
+    const int x = origin_x + threadIdx.x;
+    const int y = origin_y + threadIdx.y;
+    if (x >= size || y >= size) {
+        return;
+    }
+    const int tx = threadIdx.x + 1;
+    const int ty = threadIdx.y + 1;
+    const int n = tile[ty - 1][tx - 1] + tile[ty - 1][tx] + tile[ty - 1][tx + 1]
+                + tile[ty][tx - 1] + tile[ty][tx + 1]
+                + tile[ty + 1][tx - 1] + tile[ty + 1][tx] + tile[ty + 1][tx + 1];
+    // live iff n == 3, or alive and n == 2
+    out[(y + 1) * stride + x + 1] = (n == 3) | (tile[ty][tx] & (n == 2));
+}
+'''
+
+
+@functools.cache
+def _cuda_step_kernel() -> "cp.RawKernel":
+    """Compile the CUDA step kernel on first use."""
+    return cp.RawKernel(_CUDA_STEP_SOURCE % {'tile': CUDA_TILE_SIZE}, 'life_step')
+
+
+class CupyBoard(Board):
+    """Board living in GPU memory, stepped by a CUDA kernel.
+
+    Both boards stay on the device across steps, cells are only copied to the
+    host to draw or export the board.
+    """
+
+    def __init__(self, board_size: int):
+        if cp is None:
+            raise ImportError("CupyBoard needs cupy, install the 'gpu' extra")
+        self.board_size = board_size
+        self.board = self.make_board(board_size)
+        self.temp_board = self.make_board(board_size)
+
+    @staticmethod
+    def make_board(board_size: int) -> "cp.ndarray":
+        """Create a 2D device array representing the board.
+
+        Args:
+            board_size: Size of the square board.
+
+        Returns:
+            (board_size+2, board_size+2) byte array of zeros with a dead halo.
+        """
+        return cp.zeros((board_size + 2, board_size + 2), dtype=CELL_DTYPE)
+
+    def to_array(self) -> np.ndarray:
+        """Copy the board to a dense host array.
+
+        Returns:
+            (board_size, board_size) byte array, indexed [y, x].
+        """
+        return cp.asnumpy(self.board[1:-1, 1:-1])
+
+    def set_array(self, array: np.ndarray) -> None:
+        """Replace every cell of the board.
+
+        Args:
+            array: (board_size, board_size) array indexed [y, x], non zero cells are alive.
+        """
+        self.board[1:-1, 1:-1] = cp.asarray(array != 0, dtype=CELL_DTYPE)
+
+    def set_random_board(self, initial_cell_count: int = 10) -> None:
+        """Populate the board with random living cells.
+
+        Args:
+            initial_cell_count: Number of cells to set alive randomly.
+        """
+        cells = self.random_cells(initial_cell_count)
+        if not cells:
+            return
+        # index arrays have to be on the device too, shifted past the halo
+        xs, ys = cp.asarray([(cell.x, cell.y) for cell in cells]).T
+        self.board[ys + 1, xs + 1] = 1
+
+    def board_lines(self) -> list[str]:
+        """Render every row of the board as text.
+
+        Returns:
+            One string per row, two characters per cell.
+        """
+        return ["".join([CELL_STRINGS[cell] for cell in row]) for row in self.to_array().tolist()]
+
+    def number_of_neighbours(self, cy: int, cx: int) -> int:
+        """Count living neighbors around a cell.
+
+        Args:
+            cy: Y coordinate (row) of center cell.
+            cx: X coordinate (column) of center cell.
+
+        Returns:
+            Number of living neighbors (0-8).
+        """
+        window = cp.asnumpy(self.board[cy:cy + 3, cx:cx + 3])
+        return int(window.sum()) - int(window[1, 1])
+
+    def board_step(self) -> None:
+        """Execute one generation of Conway's Game of Life on the device.
+
+        The kernel writes the next state into temp_board and the two boards
+        are swapped.
+        """
+        size = self.board_size
+        blocks = (size + CUDA_TILE_SIZE - 1) // CUDA_TILE_SIZE
+        _cuda_step_kernel()((blocks, blocks), (CUDA_TILE_SIZE, CUDA_TILE_SIZE),
+                            (self.board, self.temp_board, np.int32(size)))
+        self.board, self.temp_board = self.temp_board, self.board
+
+
+class Node:
+    """Canonical node of a HashLife quadtree.
+
+    A level k node is a 2**k wide square made of four level k-1 quadrants,
+    level 0 nodes are single cells. Nodes are only built through _join, which
+    interns them, so identical subtrees are the same object and a future
+    memoized on a node is shared by every place that configuration appears.
+    """
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population', '_steps', '__weakref__')
+
+    def __init__(self, nw: "Node", ne: "Node", sw: "Node", se: "Node", level: int, population: int):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = level
+        self.population = population
+        # step_pow results by k, created on the first step
+        self._steps: dict[int, Node] | None = None
+
+    @classmethod
+    def leaf(cls, population: int) -> "Node":
+        """Build a level 0 node, a cell has no quadrants so they point back to it."""
+        node = cls.__new__(cls)
+        node.nw = node.ne = node.sw = node.se = node
+        node.level, node.population, node._steps = 0, population, None
+        return node
+
+    @property
+    def center(self) -> "Node":
+        """Level k-1 node made of the four innermost grandchildren."""
+        return _join(self.nw.se, self.ne.sw, self.sw.ne, self.se.nw)
+
+    def step_pow(self, k: int) -> "Node":
+        """Compute the center of the node 2**k generations ahead.
+
+        The center only depends on cells of this node for 2**(level-2)
+        generations, so k goes from 0 to level-2.
+
+        Args:
+            k: Base 2 logarithm of the number of generations.
+
+        Returns:
+            Level-1 node covering the center of this node.
+        """
+        if self.population == 0:
+            return _empty(self.level - 1)
+        steps = self._steps
+        if steps is None:
+            steps = self._steps = {}
+        elif k in steps:
+            return steps[k]
+
+        if self.level == 2:
+            result = self._step_4x4()
+        else:
+            nw, ne, sw, se = self.nw, self.ne, self.sw, self.se
+            # nine overlapping level-1 squares tiling the node
+            grid = (
+                (nw, _join(nw.ne, ne.nw, nw.se, ne.sw), ne),
+                (_join(nw.sw, nw.se, sw.nw, sw.ne), self.center, _join(ne.sw, ne.se, se.nw, se.ne)),
+                (sw, _join(sw.ne, se.nw, sw.se, se.sw), se),
+            )
+            if k == self.level - 2:
+                # two consecutive steps of 2**(k-1) generations
+                first = [[node.step_pow(k - 1) for node in row] for row in grid]
+                quadrants = [_join(first[y][x], first[y][x + 1], first[y + 1][x], first[y + 1][x + 1]).step_pow(k - 1)
+                             for y in (0, 1) for x in (0, 1)]
+            else:
+                # a single step of 2**k generations, then only keep the centers
+                first = [[node.step_pow(k) for node in row] for row in grid]
+                quadrants = [_join(first[y][x], first[y][x + 1], first[y + 1][x], first[y + 1][x + 1]).center
+                             for y in (0, 1) for x in (0, 1)]
+            result = _join(*quadrants)
+
+        steps[k] = result
+        _RETAINED.append(self)
+        return result
+
+    def _step_4x4(self) -> "Node":
+        """Compute the 2x2 center of a level 2 node one generation ahead."""
+        # bit 4*y+x is the cell (x, y) of the 4x4 square
+        cells = 0
+        for bit, quadrant in zip((0, 2, 8, 10), (self.nw, self.ne, self.sw, self.se)):
+            cells |= (quadrant.nw.population | quadrant.ne.population << 1
+                      | quadrant.sw.population << 4 | quadrant.se.population << 5) << bit
+        center = []
+        for x, y in ((1, 1), (2, 1), (1, 2), (2, 2)):
+            # the three rows of the 3x3 window around (x, y)
+            shift = 4 * (y - 1) + x - 1
+            window = (cells >> shift & 0b111) | (cells >> shift + 4 & 0b111) << 3 | (cells >> shift + 8 & 0b111) << 6
+            center.append(_LEAVES[RULE_TABLE[window]])
+        return _join(*center)
+
+    @staticmethod
+    def from_array(array: np.ndarray) -> "Node":
+        """Build the smallest node holding the array at its top left corner.
+
+        Args:
+            array: 2D array indexed [y, x], non zero cells are alive.
+
+        Returns:
+            Node of level 2 or more.
+        """
+        level = max(2, (max(array.shape) - 1).bit_length())
+        padded = np.zeros((1 << level, 1 << level), dtype=CELL_DTYPE)
+        padded[:array.shape[0], :array.shape[1]] = array != 0
+        return _node_from_array(padded, level)
+
+    def to_array(self, x: int = 0, y: int = 0, size: int | None = None) -> np.ndarray:
+        """Copy a square window of the node to a dense array.
+
+        Args:
+            x: X coordinate, in the node, of the left edge of the window.
+            y: Y coordinate, in the node, of the top edge of the window.
+            size: Width of the window, the whole node by default.
+
+        Returns:
+            (size, size) byte array indexed [y, x], cells outside the node are dead.
+        """
+        if size is None:
+            size = 1 << self.level
+        array = np.zeros((size, size), dtype=CELL_DTYPE)
+        # nodes with the window coordinates of their top left corner
+        pending = [(self, -x, -y)]
+        while pending:
+            node, nx, ny = pending.pop()
+            width = 1 << node.level
+            if node.population == 0 or nx >= size or ny >= size or nx + width <= 0 or ny + width <= 0:
+                continue
+            if node.level == 0:
+                array[ny, nx] = 1
+                continue
+            half = width >> 1
+            pending += ((node.nw, nx, ny), (node.ne, nx + half, ny),
+                        (node.sw, nx, ny + half), (node.se, nx + half, ny + half))
+        return array
+
+
+# Interned nodes by their quadrants, entries go away with the nodes
+_NODES: weakref.WeakValueDictionary[tuple[Node, Node, Node, Node], Node] = weakref.WeakValueDictionary()
+# The most recently stepped nodes are kept alive so their memoized futures can
+# be reused, older ones are released once nothing else references them
+_RETAINED: collections.deque[Node] = collections.deque(maxlen=HASHLIFE_CACHE_SIZE)
+_DEAD = Node.leaf(0)
+_ALIVE = Node.leaf(1)
+# level 0 nodes by cell value
+_LEAVES = (_DEAD, _ALIVE)
+
+
+def _join(nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+    """Get the canonical node with the given quadrants."""
+    key = (nw, ne, sw, se)
+    node = _NODES.get(key)
+    if node is None:
+        node = Node(nw, ne, sw, se, nw.level + 1, nw.population + ne.population + sw.population + se.population)
+        _NODES[key] = node
+    return node
+
+
+@functools.cache
+def _empty(level: int) -> Node:
+    """Get the canonical dead node of a level."""
+    if level == 0:
+        return _DEAD
+    quadrant = _empty(level - 1)
+    return _join(quadrant, quadrant, quadrant, quadrant)
+
+
+def _node_from_array(array: np.ndarray, level: int) -> Node:
+    """Build the node of a 2**level wide array."""
+    if not array.any():
+        return _empty(level)
+    if level == 0:
+        return _ALIVE
+    half = 1 << (level - 1)
+    return _join(_node_from_array(array[:half, :half], level - 1), _node_from_array(array[:half, half:], level - 1),
+                 _node_from_array(array[half:, :half], level - 1), _node_from_array(array[half:, half:], level - 1))
+
+
+def _expand(node: Node) -> Node:
+    """Surround the node with dead cells, doubling its width and keeping it centered."""
+    empty = _empty(node.level - 1)
+    return _join(_join(empty, empty, empty, node.nw), _join(empty, empty, node.ne, empty),
+                 _join(empty, node.sw, empty, empty), _join(node.se, empty, empty, empty))
+
+
+def hashlife(array: np.ndarray, generations: int) -> np.ndarray:
+    """Advance a square array many generations with HashLife.
+
+    The pattern evolves in an unbounded universe and only the cells inside the
+    array are copied back at the end.
+
+    Args:
+        array: Square array indexed [y, x], non zero cells are alive.
+        generations: Number of generations to advance.
+
+    Returns:
+        Array of the same shape with the advanced cells.
+
+    Raises:
+        ValueError: If generations is negative.
+    """
+    if generations < 0:
+        raise ValueError(f"Cannot advance a negative number of generations: {generations}")
+    node = Node.from_array(array)
+    # array coordinates of the top left corner of node
+    x = y = 0
+    k = 0
+    while generations:
+        if generations & 1:
+            # grow until the node can step 2**k generations and all the cells are
+            # in its inner quarter, so none can leave the returned center
+            while node.level < k + 3 or node.center.center.population != node.population:
+                half = 1 << (node.level - 1)
+                node, x, y = _expand(node), x - half, y - half
+            quarter = 1 << (node.level - 2)
+            node, x, y = node.step_pow(k), x + quarter, y + quarter
+        generations >>= 1
+        k += 1
+    return node.to_array(-x, -y, array.shape[0])
+
+
+ENGINES = {'numpy': Board, 'bits': BitBoard, 'sparse': SparseBoard, 'cupy': CupyBoard}
 
-def main(board_size: int, freq: float, periods: int, saturation: float, pattern: str):
+def main(board_size: int, freq: float, periods: int, saturation: float, pattern: str, engine: str = 'numpy',
+         jump: int = 0, use_hashlife: bool = False):
     """Run Game of Life simulation with specified parameters.
 
     Args:
@@ -207,14 +1023,18 @@ def main(board_size: int, freq: float, periods: int, saturation: float, pattern:
         freq: Refresh frequency (unused in this version).
         periods: Number of generations to simulate.
         saturation: Initial population density (0.0 to 1.0).
+        engine: Name of the board implementation, one of ENGINES.
+        jump: Generations to advance before drawing.
+        use_hashlife: Advance the jump with HashLife instead of stepping the board.
     """
-    board = Board(board_size)
+    board = ENGINES[engine](board_size)
     if pattern == 'random':
         board.set_random_board(int(board_size*board_size*saturation))
     else:
         pattern_cells, bounding_box = Board.load_file_figure(pattern)
         board.load_patter(pattern_cells, bounding_box, Cell(x=2, y=2))
-    board.run(periods=periods, sleep_time=freq)
+    board.advance(jump, use_hashlife=use_hashlife)
+    board.run(periods=periods, sleep_time=freq, start=jump)
 
 if __name__ == "__main__":
 
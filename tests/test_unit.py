@@ -1,8 +1,18 @@
+import os
+import random
+import subprocess
+import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from cwgol import Board
+import cwgol
+from cwgol import BitBoard, Board, Cell, SparseBoard
+
+
+def live_cells(board):
+    return {(x, y) for y in range(board.board_size) for x in range(board.board_size) if board.get_cell(x, y)}
 
 
 @pytest.mark.parametrize("filename, len_cells, bounding_box", [
@@ -15,4 +25,187 @@ def test_load_figure(filename, len_cells, bounding_box):
     input_figure_path = Path(__file__).parent / filename
     cells, bb = Board.load_file_figure(str(input_figure_path))
     assert len(cells) == len_cells
-    assert bb == bounding_box
\ No newline at end of file
+    assert bb == bounding_box
+
+
+def test_load_figure_starts_at_origin():
+    cells, _ = Board.load_file_figure(str(Path(__file__).parent / 'glider.cells'))
+    assert set(cells) == {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+    board = Board(3)
+    board.load_patter(cells, 3, Cell(x=0, y=0))
+    assert live_cells(board) == set(cells)
+
+
+def test_random_cells_are_distinct():
+    board = Board(6)
+    cells = board.random_cells(30)
+    assert len(cells) == 30
+    assert all(0 <= cell.x < 6 and 0 <= cell.y < 6 for cell in cells)
+    assert len(board.random_cells(100)) == 36
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard, SparseBoard])
+def test_set_random_board(board_class):
+    board = board_class(8)
+    board.set_blinker(Cell(x=4, y=4))
+    board.set_random_board(20)
+    assert len(live_cells(board)) >= 20
+    assert {(4, 3), (4, 4), (4, 5)} <= live_cells(board)
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard, SparseBoard])
+@pytest.mark.parametrize("x, y", [(-1, 2), (5, 2), (2, -1), (2, 5)])
+def test_set_cell_rejects_cells_off_the_board(board_class, x, y):
+    board = board_class(5)
+    with pytest.raises(IndexError):
+        board.set_cell(x, y, True)
+    assert (board.to_array() == 0).all()
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard, SparseBoard])
+def test_blinker_off_the_edge_is_rejected(board_class):
+    with pytest.raises(IndexError):
+        board_class(5).set_blinker(Cell(x=2, y=0))
+
+
+def test_blinker_oscillates():
+    board = Board(5)
+    board.set_blinker(Cell(x=2, y=2))
+    board.board_step()
+    assert live_cells(board) == {(1, 2), (2, 2), (3, 2)}
+    board.board_step()
+    assert live_cells(board) == {(2, 1), (2, 2), (2, 3)}
+
+
+def test_edges_are_dead():
+    board = Board(4)
+    board.set_blinker(Cell(x=0, y=1))
+    board.board_step()
+    assert live_cells(board) == {(0, 1), (1, 1)}
+    assert board.number_of_neighbours(0, 0) == 2
+
+
+def engine_board(engine, board):
+    """Copy a board into a board of the named engine, skipping engines that are not installed."""
+    if engine == 'cupy':
+        pytest.importorskip("cupy")
+    return cwgol.ENGINES[engine].from_array(board.to_array())
+
+
+@pytest.mark.parametrize("engine", list(cwgol.ENGINES))
+@pytest.mark.parametrize("size", [17, 260])
+def test_engine_matches_board(engine, size):
+    random.seed(3)
+    board = Board(size)
+    board.set_random_board(size * size // 3)
+    other = engine_board(engine, board)
+    for _ in range(10):
+        board.board_step()
+        other.board_step()
+        assert (other.to_array() == board.to_array()).all()
+
+
+@pytest.mark.parametrize("engine", list(cwgol.ENGINES))
+def test_engine_counts_neighbours(engine):
+    random.seed(5)
+    board = Board(70)
+    board.set_random_board(70 * 70 // 3)
+    other = engine_board(engine, board)
+    for y, x in [(0, 0), (8, 69), (69, 69), (35, 64)]:
+        assert other.number_of_neighbours(y, x) == board.number_of_neighbours(y, x)
+
+
+@pytest.mark.parametrize("size", [30, 300])
+def test_numpy_fallback_matches_kernel(monkeypatch, size):
+    random.seed(5)
+    board = Board(size)
+    board.set_random_board(size * size // 3)
+    fallback = Board.from_array(board.to_array())
+    board.board_step()
+    with monkeypatch.context() as patch:
+        patch.setattr(cwgol, "njit", None)
+        patch.setattr(cwgol.os, "cpu_count", lambda: 4)
+        fallback.board_step()
+    assert (fallback.to_array() == board.to_array()).all()
+
+
+def kernel_threading(cache_dir, size):
+    """Step a fresh board in a new process and report if numba threads were started."""
+    code = ("import numba, cwgol\n"
+            f"cwgol.Board({size}).board_step()\n"
+            "try:\n    print(numba.threading_layer())\nexcept ValueError:\n    print('serial')\n")
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(cache_dir))
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize("first_size", [8, cwgol.PARALLEL_BOARD_SIZE])
+def test_cached_kernels_keep_their_build(tmp_path, first_size):
+    pytest.importorskip("numba")
+    # whichever build is cached first, the other one must not load it
+    kernel_threading(tmp_path, first_size)
+    assert kernel_threading(tmp_path, 8) == 'serial'
+    assert kernel_threading(tmp_path, cwgol.PARALLEL_BOARD_SIZE) != 'serial'
+
+
+@pytest.mark.parametrize("board_class", [Board, BitBoard, SparseBoard])
+def test_draw_board(board_class, capsys):
+    board = board_class(3)
+    board.set_blinker(Cell(x=0, y=1))
+    board.draw_board("title")
+    assert capsys.readouterr().out.endswith("title\no     \no     \no     \n")
+
+
+def test_hashlife_matches_stepping():
+    random.seed(11)
+    board = Board(128)
+    for cell in board.random_cells(200):
+        board.set_cell(cell.x % 20 + 54, cell.y % 20 + 54, True)
+    jumped = Board.from_array(board.to_array())
+    board.advance(45, use_hashlife=False)
+    jumped.advance(45, use_hashlife=True)
+    assert live_cells(jumped) == live_cells(board)
+
+
+def test_hashlife_long_jump():
+    board = SparseBoard(9)
+    board.set_blinker(Cell(x=4, y=4))
+    board.advance(2 ** 20 + 1, use_hashlife=True)
+    assert live_cells(board) == {(3, 4), (4, 4), (5, 4)}
+
+    glider = Board(64)
+    glider.load_patter(*Board.load_file_figure(str(Path(__file__).parent / 'glider.cells')), Cell(x=0, y=0))
+    start = live_cells(glider)
+    glider.advance(32, use_hashlife=True)
+    assert live_cells(glider) == {(x + 8, y + 8) for x, y in start}
+    # past the edge HashLife keeps the glider flying instead of stepping it into it
+    jumped = Board.from_array(glider.to_array())
+    jumped.advance(2048, use_hashlife=True)
+    assert live_cells(jumped) == set()
+
+
+def test_advance_steps_by_default():
+    glider = Board(64)
+    glider.load_patter(*Board.load_file_figure(str(Path(__file__).parent / 'glider.cells')), Cell(x=0, y=0))
+    stepped = Board.from_array(glider.to_array())
+    glider.advance(2048)
+    for _ in range(2048):
+        stepped.board_step()
+    assert live_cells(glider) == live_cells(stepped) != set()
+
+
+@pytest.mark.parametrize("use_hashlife", [False, True])
+def test_advance_rejects_negative_generations(use_hashlife):
+    with pytest.raises(ValueError):
+        Board(8).advance(-3, use_hashlife=use_hashlife)
+    with pytest.raises(ValueError):
+        cwgol.hashlife(np.zeros((8, 8), dtype=cwgol.CELL_DTYPE), -1)
+
+
+def test_cli_rejects_negative_jump():
+    script = Path(__file__).parent.parent / 'cw-gol.py'
+    result = subprocess.run([sys.executable, str(script), "-j", "-2", "--hashlife"],
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 2
+    assert "--jump" in result.stderr